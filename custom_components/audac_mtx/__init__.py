@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from pathlib import Path
 
 from homeassistant.components.http import StaticPathConfig
@@ -10,14 +11,19 @@ from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, CARD_URL_PATH, CARD_FILENAME, XMP44_CARD_FILENAME, XMP44_CARD_URL_PATH, CONF_MODEL, MODEL_MTX48, MODEL_MTX88, MODEL_XMP44, MODEL_ZONES, is_xmp_model
+from .const import DOMAIN, CARD_URL_PATH, CARD_FILENAME, XMP44_CARD_FILENAME, XMP44_CARD_URL_PATH, CONF_MODEL, MODEL_MTX48, MODEL_MTX88, MODEL_XMP44, get_zones_count, is_xmp_model
 from .coordinator import AudacMTXCoordinator
 from .xmp44_coordinator import XMP44Coordinator
+from .helpers import _async_update_zone_visibility
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# MTX zone options that are read live from entry.options (visibility and
+# coupling in all three formats) — changing only these needs no reload.
+_LIVE_ZONE_OPTION_RE = re.compile(r"zone_\d+_(visible|link|links|linked_to)")
+
 
 def _read_card_version(js_path: Path) -> str:
     """Read CARD_VERSION from the first line of a JS file.
@@ -71,7 +77,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if not hass.data[DOMAIN].get("loaded"):
         hass.data[DOMAIN]["loaded"] = True  # Set early to prevent race condition
-        await _register_card(hass)
+        # Card registration only touches the frontend; don't hold up the
+        # device connection and platform setup while it runs.
+        hass.async_create_task(_register_card(hass), "audac_mtx_register_card")
 
     model = entry.data.get(CONF_MODEL, "mtx88")
 
@@ -98,7 +106,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _register_card(hass: HomeAssistant) -> None:
     www_dir = Path(__file__).parent / "www"
-    if not www_dir.is_dir():
+    if not await hass.async_add_executor_job(www_dir.is_dir):
         _LOGGER.warning("Audac www directory not found at %s", www_dir)
         return
 
@@ -106,6 +114,7 @@ async def _register_card(hass: HomeAssistant) -> None:
     # Use executor to avoid blocking the event loop
     mtx_version = await hass.async_add_executor_job(_read_card_version, www_dir / CARD_FILENAME)
     xmp44_version = await hass.async_add_executor_job(_read_card_version, www_dir / XMP44_CARD_FILENAME)
+    has_xmp44_card = await hass.async_add_executor_job((www_dir / XMP44_CARD_FILENAME).exists)
 
     mtx_url_versioned = f"{CARD_URL_PATH}?v={mtx_version}"
     xmp44_url_versioned = f"{XMP44_CARD_URL_PATH}?v={xmp44_version}"
@@ -118,7 +127,7 @@ async def _register_card(hass: HomeAssistant) -> None:
             cache_headers=False,
         ),
     ]
-    if (www_dir / XMP44_CARD_FILENAME).exists():
+    if has_xmp44_card:
         paths.append(
             StaticPathConfig(
                 XMP44_CARD_URL_PATH,
@@ -137,7 +146,7 @@ async def _register_card(hass: HomeAssistant) -> None:
 
     # Register as Lovelace storage resources
     await _register_lovelace_resource(hass, CARD_URL_PATH, mtx_url_versioned, "MTX")
-    if (www_dir / XMP44_CARD_FILENAME).exists():
+    if has_xmp44_card:
         await _register_lovelace_resource(hass, XMP44_CARD_URL_PATH, xmp44_url_versioned, "XMP44")
 
 
@@ -188,6 +197,20 @@ async def _register_lovelace_resource(hass: HomeAssistant, url_path: str, url_ve
 
 
 async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    if isinstance(coordinator, AudacMTXCoordinator):
+        previous = coordinator.options_snapshot
+        changed = {
+            key for key in previous.keys() | entry.options.keys()
+            if previous.get(key) != entry.options.get(key)
+        }
+        if changed and all(_LIVE_ZONE_OPTION_RE.fullmatch(key) for key in changed):
+            _LOGGER.debug("Audac MTX: applying zone visibility/coupling change without reload: %s", sorted(changed))
+            coordinator.options_snapshot = dict(entry.options)
+            zones_count = get_zones_count(entry.data)
+            await _async_update_zone_visibility(hass, entry, zones_count, DOMAIN)
+            coordinator.async_update_listeners()
+            return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
@@ -196,5 +219,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     platforms = PLATFORMS_XMP44 if is_xmp_model(model) else PLATFORMS_MTX
     unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            # Release the persistent TCP connection right away so a reload
+            # doesn't race the old socket against the new client.
+            await coordinator.client.disconnect()
     return unload_ok
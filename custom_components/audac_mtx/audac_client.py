@@ -15,7 +15,11 @@ SET responses echo the command with '+' as data.
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 import logging
+import random
+import re
+import socket
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,8 +27,34 @@ _LOGGER = logging.getLogger(__name__)
 MAX_RETRIES = 1
 RECONNECT_DELAY = 1.0
 RECONNECT_MAX_DELAY = 30.0
+# After this many consecutive failures, commands issued during the reconnect
+# backoff fail immediately instead of queueing up behind the lock.
+CIRCUIT_OPEN_THRESHOLD = 3
+# Minimum gap between two commands sent to the device (seconds).
+# Enforced centrally in _send_and_receive() via _wait_for_command_slot().
 INTER_COMMAND_DELAY = 0.15
 
+# Constant frame terminator: checksum placeholder 'U' plus CRLF.
+COMMAND_SUFFIX = b"|U|\r\n"
+
+# Validates a raw response frame and captures its sender and command fields:
+#   #|<source or ALL>|<address>|CMD|data...
+# Matched on bytes so frames for other commands are skipped undecoded.
+RESPONSE_RE = re.compile(rb"#\|([^|]*)\|[^|]*\|([^|]*)\|")
+
+# A signed integer data field as int() accepts it, e.g. "12", "-6" or " +5".
+INT_RE = re.compile(r"\s*[+-]?\d+\s*")
+
+# Upper bound for an unterminated partial line kept between reads (bytes).
+# Real frames are far shorter (GFAV lists included); anything longer means
+# the device is streaming garbage without CR/LF and is dropped.
+MAX_PENDING_BYTES = 16384
+
+# Give up on a read after this many malformed or mismatched directed frames;
+# a device that keeps answering garbage won't produce the reply in time
+# either. Unrelated ALL broadcasts are expected traffic and don't count.
+MAX_DISCARDED_FRAMES = 16
+
 # Hard timeout for a single send-and-receive cycle (seconds).
 # This covers: lock acquisition + connect + send + read + 1 retry.
 # Must be larger than the longest inner read timeout (5s for GFAV)
@@ -46,6 +76,10 @@ class AudacClient:
         self._writer: asyncio.StreamWriter | None = None
         self._lock = asyncio.Lock()
         self._consecutive_failures = 0
+        self._reconnect_at = 0.0
+        self._last_command_time = 0.0
+        # Address and source never change after init — encode the frame prefix once.
+        self._command_prefix = f"#|{self.DEVICE_ADDRESS}|{source}|".encode()
 
     @property
     def host(self) -> str:
@@ -55,7 +89,12 @@ class AudacClient:
     def connected(self) -> bool:
         return self._writer is not None
 
-    async def connect(self) -> None:
+    async def connect(self, settle: bool = True) -> None:
+        """Open the connection.
+
+        With settle=False the post-connect pause and stale-data flush are
+        skipped — enough for a reachability probe that sends nothing.
+        """
         if self._writer is not None:
             return
         try:
@@ -63,13 +102,15 @@ class AudacClient:
                 asyncio.open_connection(self._host, self._port),
                 timeout=3,
             )
+            self._configure_socket()
             self._consecutive_failures = 0
             _LOGGER.debug(
                 "Connected to Audac %s at %s:%s",
                 self.DEVICE_ADDRESS, self._host, self._port,
             )
-            await asyncio.sleep(0.3)
-            await self._flush_buffer()
+            if settle:
+                await asyncio.sleep(0.3)
+                await self._flush_buffer()
         except Exception as err:
             self._reader = None
             self._writer = None
@@ -77,6 +118,27 @@ class AudacClient:
                 f"Cannot connect to Audac device at {self._host}:{self._port}: {err}"
             ) from err
 
+    def _configure_socket(self) -> None:
+        """Disable Nagle and enable TCP keepalive on the persistent socket.
+
+        Frames are tiny write-then-read exchanges, so Nagle only adds delay.
+        Keepalive lets a silently dropped connection (NAT, device power
+        loss) surface before the next command runs into its timeout.
+        """
+        sock = self._writer.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Linux-only tuning; other platforms keep the OS defaults.
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        except OSError as err:
+            _LOGGER.debug("Could not set socket options: %s", err)
+
     async def disconnect(self) -> None:
         if self._writer is not None:
             self._writer.close()
@@ -87,92 +149,147 @@ class AudacClient:
             self._writer = None
             self._reader = None
 
+    def _force_disconnect(self) -> None:
+        """Drop the connection without waiting for the close to finish.
+
+        Used on hard timeouts, where awaiting wait_closed() on a hung
+        socket could block again. The transport is still closed so the
+        socket isn't leaked until garbage collection.
+        """
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = None
+        self._reader = None
+
     async def _ensure_connected(self) -> None:
+        if self._writer is not None and self._writer.is_closing():
+            # Peer closed the socket since the last command — drop it so
+            # we reconnect instead of failing the first write.
+            self._force_disconnect()
         if self._writer is None:
             if self._consecutive_failures > 0:
-                delay = min(
-                    RECONNECT_DELAY * (2 ** (self._consecutive_failures - 1)),
-                    RECONNECT_MAX_DELAY,
-                )
-                await asyncio.sleep(delay)
+                wait = self._reconnect_at - asyncio.get_running_loop().time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
             await self.connect()
 
+    def _raise_if_unavailable(self) -> None:
+        """Fail fast while a repeatedly unreachable device is in backoff.
+
+        Doesn't count as another failure, so it never pushes the next
+        reconnect attempt further out.
+        """
+        if self._writer is not None or self._consecutive_failures < CIRCUIT_OPEN_THRESHOLD:
+            return
+        wait = self._reconnect_at - asyncio.get_running_loop().time()
+        if wait > 0:
+            raise ConnectionError(
+                f"Audac device at {self._host}:{self._port} unavailable, "
+                f"next reconnect in {wait:.1f}s"
+            )
+
+    def _record_failure(self) -> None:
+        """Count a failure and schedule the earliest next reconnect."""
+        self._consecutive_failures += 1
+        delay = min(
+            RECONNECT_DELAY * (2 ** (self._consecutive_failures - 1)),
+            RECONNECT_MAX_DELAY,
+        )
+        # Full jitter: clients that lost the device together don't
+        # all reconnect in lockstep.
+        self._reconnect_at = asyncio.get_running_loop().time() + random.uniform(0, delay)
+
     async def _flush_buffer(self) -> None:
         if self._reader is None:
             return
-        flushed = b""
+        flushed = 0
         while True:
             try:
                 chunk = await asyncio.wait_for(self._reader.read(4096), timeout=0.05)
                 if not chunk:
                     break
-                flushed += chunk
+                flushed += len(chunk)
             except asyncio.TimeoutError:
                 break
         if flushed:
-            _LOGGER.debug("Audac flushed %d bytes of stale data", len(flushed))
+            _LOGGER.debug("Audac flushed %d bytes of stale data", flushed)
+
+    async def _wait_for_command_slot(self) -> None:
+        """Keep at least INTER_COMMAND_DELAY between two consecutive commands.
+
+        Only the remaining part of the gap is slept, so callers that already
+        spent time elsewhere (parsing, other awaits) are not delayed twice.
+        """
+        remaining = self._last_command_time + INTER_COMMAND_DELAY - asyncio.get_running_loop().time()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
 
     def _build_command(self, command: str, argument: str = "0") -> bytes:
-        return f"#|{self.DEVICE_ADDRESS}|{self._source}|{command}|{argument}|U|\r\n".encode()
+        return self._command_prefix + f"{command}|{argument}".encode() + COMMAND_SUFFIX
 
     @staticmethod
-    def _expected_response_cmds(command: str) -> set[str]:
-        result = {command}
+    @lru_cache(maxsize=256)
+    def _expected_response_cmds(command: str) -> frozenset[str]:
+        # The command set is small and fixed, so build each answer once.
         if command.startswith("G"):
-            result.add(command[1:])
-        return result
+            return frozenset((command, command[1:]))
+        return frozenset((command,))
 
-    async def _read_response(self, expected_cmds: set[str], timeout: float = 2.0) -> str:
+    async def _read_response(self, expected_cmds: frozenset[str], timeout: float = 2.0) -> str:
         buffer = b""
-        loop = asyncio.get_running_loop()
-        deadline = loop.time() + timeout
-        while True:
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                break
-            try:
-                chunk = await asyncio.wait_for(
-                    self._reader.read(4096),
-                    timeout=min(remaining, 0.5),
-                )
-                if not chunk:
-                    break
-                buffer += chunk
-                _LOGGER.debug("Audac raw recv chunk (%d bytes): %s", len(chunk), chunk[:200])
-                text = buffer.decode(errors="replace")
-                lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
-                for line in lines[:-1]:
-                    line = line.strip()
-                    if not line or not line.startswith("#|"):
-                        continue
-                    parts = line.split("|")
-                    if len(parts) < 5:
-                        continue
-                    # Determine response command field position:
-                    # Directed: #|source|address|CMD|data|checksum  → parts[3]
-                    # Broadcast: #|ALL|address|CMD|data|checksum    → parts[3]
-                    if parts[1].strip() == "ALL":
-                        # Broadcast response — accept if command matches
-                        resp_cmd = parts[3].strip()
+        discarded = 0
+        # One deadline for the whole read instead of a wait_for (and its
+        # timer handle) per chunk.
+        try:
+            async with asyncio.timeout(timeout):
+                while True:
+                    chunk = await self._reader.read(4096)
+                    if not chunk:
+                        break
+                    buffer += chunk
+                    _LOGGER.debug("Audac raw recv chunk (%d bytes): %s", len(chunk), chunk[:200])
+                    lines = buffer.replace(b"\r", b"\n").split(b"\n")
+                    for raw_line in lines[:-1]:
+                        match = RESPONSE_RE.match(raw_line.strip())
+                        if match is None:
+                            if raw_line.strip():
+                                discarded += 1
+                            continue
+                        # Directed: #|source|address|CMD|data|checksum
+                        # Broadcast: #|ALL|address|CMD|data|checksum
+                        # Directed replies and broadcasts are accepted alike when
+                        # the command matches (the line itself shows which it was).
+                        resp_cmd = match.group(2).strip().decode(errors="replace")
                         if resp_cmd in expected_cmds:
-                            _LOGGER.debug("Audac matched (ALL) %s: %s", expected_cmds, line[:120])
+                            line = raw_line.strip().decode(errors="replace")
+                            _LOGGER.debug("Audac matched %s: %s", expected_cmds, line[:120])
                             return line
-                        continue
-                    resp_cmd = parts[3].strip()
-                    if resp_cmd in expected_cmds:
-                        _LOGGER.debug("Audac matched %s: %s", expected_cmds, line[:120])
-                        return line
-                    _LOGGER.debug(
-                        "Skipping mismatched response: got '%s', expected %s: %s",
-                        resp_cmd, expected_cmds, line[:80],
-                    )
-                last_line = lines[-1]
-                if last_line and last_line.strip():
-                    buffer = last_line.encode()
-                else:
-                    buffer = b""
-            except asyncio.TimeoutError:
-                continue
+                        if match.group(1).strip() == b"ALL":
+                            # Unrelated broadcast — normal background noise
+                            continue
+                        discarded += 1
+                        _LOGGER.debug(
+                            "Skipping mismatched response: got '%s', expected %s: %s",
+                            resp_cmd, expected_cmds, raw_line[:80],
+                        )
+                    if discarded >= MAX_DISCARDED_FRAMES:
+                        _LOGGER.debug(
+                            "Audac giving up on %s after %d discarded frames",
+                            expected_cmds, discarded,
+                        )
+                        return ""
+                    last_line = lines[-1]
+                    if last_line and last_line.strip():
+                        buffer = last_line
+                        if len(buffer) > MAX_PENDING_BYTES:
+                            _LOGGER.debug(
+                                "Audac dropping %d bytes of unterminated data", len(buffer)
+                            )
+                            buffer = b""
+                    else:
+                        buffer = b""
+        except asyncio.TimeoutError:
+            pass
         if buffer:
             _LOGGER.debug(
                 "Audac no match in buffer for %s: %s",
@@ -191,20 +308,25 @@ class AudacClient:
 
         async def _do() -> str:
             async with self._lock:
+                self._raise_if_unavailable()
                 for attempt in range(MAX_RETRIES + 1):
                     try:
                         await self._ensure_connected()
                     except ConnectionError:
+                        self._record_failure()
                         if attempt < MAX_RETRIES:
-                            self._consecutive_failures += 1
                             continue
                         raise
+                    await self._wait_for_command_slot()
                     await self._flush_buffer()
                     raw = self._build_command(command, argument)
                     try:
                         self._writer.write(raw)
                         await self._writer.drain()
-                        response = await self._read_response(expected_cmds, timeout=timeout)
+                        try:
+                            response = await self._read_response(expected_cmds, timeout=timeout)
+                        finally:
+                            self._last_command_time = asyncio.get_running_loop().time()
                         if not response:
                             if attempt < MAX_RETRIES:
                                 await self.disconnect()
@@ -217,7 +339,7 @@ class AudacClient:
                             "Audac error cmd=%s attempt=%d: %s", command, attempt, err
                         )
                         await self.disconnect()
-                        self._consecutive_failures += 1
+                        self._record_failure()
                         if attempt < MAX_RETRIES:
                             continue
                         raise ConnectionError(f"Lost connection to Audac device: {err}") from err
@@ -236,19 +358,22 @@ class AudacClient:
                 "Audac command %s timed out after %.0fs — forcing disconnect",
                 command, COMMAND_TIMEOUT,
             )
-            self._writer = None
-            self._reader = None
-            self._consecutive_failures += 1
+            self._force_disconnect()
+            self._record_failure()
             raise ConnectionError(f"Command {command} timed out") from None
 
     @staticmethod
     def _get_data_field(response: str) -> str:
         if not response:
             return ""
-        parts = response.split("|")
-        if len(parts) >= 5:
-            return parts[4].strip()
-        return ""
+        # Skip the four leading fields (#, source, address, CMD) without
+        # building a list; the data field runs up to the next separator.
+        rest = response
+        for _ in range(4):
+            _, sep, rest = rest.partition("|")
+            if not sep:
+                return ""
+        return rest.partition("|")[0].strip()
 
     @staticmethod
     def _is_success(response: str) -> bool:
@@ -261,11 +386,12 @@ class AudacClient:
         data = self._get_data_field(resp)
         if not data or data == "+":
             return None
-        try:
-            return int(data)
-        except ValueError:
+        # Pre-check instead of try/except: firmware placeholders like "--"
+        # would otherwise raise on every poll.
+        if INT_RE.fullmatch(data) is None:
             _LOGGER.debug("Could not parse %s response: %s", command, data)
             return None
+        return int(data)
 
     async def _get_string_value(self, command: str) -> str | None:
         """Send a GET command and return the data field as string."""
@@ -12,7 +12,7 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, MODEL_ZONES, is_xmp_model
+from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, get_zones_count, is_xmp_model
 from .xmp44_coordinator import XMP44Coordinator
 from .xmp44_client import MODULE_FMP40, MODULE_IMP40, MODULE_BMP40, MODULE_DMP40, MODULE_TMP40, MODULE_MMP40, MODULES_WITH_TUNER
 
@@ -87,8 +87,7 @@ async def _setup_mtx_buttons(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Create MTX-specific buttons: Save, Volume Up/Down per zone."""
-    from .entity import AudacMTXBaseEntity
-    zones_count = entry.data.get("zones", MODEL_ZONES.get(entry.data.get(CONF_MODEL, MODEL_MTX88), 8))
+    zones_count = get_zones_count(entry.data)
 
     entities: list[ButtonEntity] = []
 
@@ -118,12 +117,11 @@ async def _setup_xmp44_buttons(
 
     entities: list[ButtonEntity] = []
 
+    # Parsed once from the slot options by the coordinator.
+    module_types = coordinator.client.module_types
+
     for slot in range(1, slots_count + 1):
-        module_str = entry.options.get(f"slot_{slot}_module", "0")
-        try:
-            module_type = int(module_str)
-        except (ValueError, TypeError):
-            module_type = 0
+        module_type = module_types.get(slot, 0)
 
         # FMP40: Trigger buttons
         if module_type == MODULE_FMP40:
@@ -498,14 +496,7 @@ class MTXSaveButton(AudacButtonBase):
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_mtx_save"
         self._attr_name = "Einstellungen speichern"
-        from .const import MODEL_NAMES, CONF_MODEL, MODEL_MTX88
-        model = entry.data.get(CONF_MODEL, MODEL_MTX88)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.data.get("name", "Audac MTX"),
-            "manufacturer": "Audac",
-            "model": MODEL_NAMES.get(model, "MTX"),
-        }
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         await self.coordinator.client.save()
@@ -523,14 +514,7 @@ class MTXVolumeUpButton(AudacButtonBase):
         zone_name = entry.options.get(f"zone_{zone}_name", f"Zone {zone}")
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone}_vol_up"
         self._attr_name = f"{zone_name} Lauter"
-        from .const import MODEL_NAMES, CONF_MODEL, MODEL_MTX88
-        model = entry.data.get(CONF_MODEL, MODEL_MTX88)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.data.get("name", "Audac MTX"),
-            "manufacturer": "Audac",
-            "model": MODEL_NAMES.get(model, "MTX"),
-        }
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         await self.coordinator.client.set_volume_up(self._zone)
@@ -549,14 +533,7 @@ class MTXVolumeDownButton(AudacButtonBase):
         zone_name = entry.options.get(f"zone_{zone}_name", f"Zone {zone}")
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone}_vol_down"
         self._attr_name = f"{zone_name} Leiser"
-        from .const import MODEL_NAMES, CONF_MODEL, MODEL_MTX88
-        model = entry.data.get(CONF_MODEL, MODEL_MTX88)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.data.get("name", "Audac MTX"),
-            "manufacturer": "Audac",
-            "model": MODEL_NAMES.get(model, "MTX"),
-        }
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         await self.coordinator.client.set_volume_down(self._zone)
@@ -19,10 +19,13 @@ from .const import (
     MODEL_XMP44,
     MODEL_ZONES,
     MODEL_SLOTS,
-    INPUT_NAMES,
+    SOURCE_OPTION_KEYS,
     is_mtx_model,
     is_xmp_model,
 )
+from .audac_client import AudacClient
+from .mtx_client import MTXClient
+from .xmp44_client import XMP44Client
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +44,36 @@ DATA_SCHEMA = vol.Schema(
     }
 )
 
+# XMP44 slot module choices are fixed; one selector is shared by all slots.
+XMP_MODULE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="0", label="Kein Modul"),
+            selector.SelectOptionDict(value="1", label="DMP40 (DAB/DAB+ & FM Tuner)"),
+            selector.SelectOptionDict(value="2", label="TMP40 (FM Tuner)"),
+            selector.SelectOptionDict(value="3", label="MMP40 (Media Player/Recorder)"),
+            selector.SelectOptionDict(value="4", label="IMP40 (Internet Radio)"),
+            selector.SelectOptionDict(value="6", label="FMP40 (Voice File)"),
+            selector.SelectOptionDict(value="8", label="BMP40 (Bluetooth)"),
+            selector.SelectOptionDict(value="9", label="NMP40 (Network Player)"),
+        ],
+        multiple=False,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
+FMP40_TRIGGER_COUNT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0, max=50, step=1, mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+
+def _create_client(model: str, host: str, port: int) -> AudacClient:
+    """Return the protocol client matching the selected model."""
+    client_cls = XMP44Client if is_xmp_model(model) else MTXClient
+    return client_cls(host=host, port=port)
+
 
 class AudacMTXConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 2
@@ -53,26 +86,20 @@ class AudacMTXConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             model = user_input.get(CONF_MODEL, MODEL_MTX88)
 
+            # Reject an already configured host before touching the network.
+            await self.async_set_unique_id(f"audac_mtx_{user_input[CONF_HOST]}")
+            self._abort_if_unique_id_configured()
+
             if is_xmp_model(model):
-                from .xmp44_client import XMP44Client
                 user_input["slots"] = MODEL_SLOTS[model]
-                client = XMP44Client(
-                    host=user_input[CONF_HOST],
-                    port=user_input.get(CONF_PORT, DEFAULT_PORT),
-                )
             else:
-                from .mtx_client import MTXClient
                 user_input["zones"] = MODEL_ZONES[model]
-                client = MTXClient(
-                    host=user_input[CONF_HOST],
-                    port=user_input.get(CONF_PORT, DEFAULT_PORT),
-                )
+            client = _create_client(
+                model, user_input[CONF_HOST], user_input.get(CONF_PORT, DEFAULT_PORT)
+            )
 
             try:
-                await client.connect()
-
-                await self.async_set_unique_id(f"audac_mtx_{user_input[CONF_HOST]}")
-                self._abort_if_unique_id_configured()
+                await client.connect(settle=False)
 
                 return self.async_create_entry(
                     title=user_input.get("name", "Audac MTX"),
@@ -97,6 +124,9 @@ class AudacMTXConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class AudacMTXOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self._config_entry = config_entry
+        # The entry's options don't change while this flow is open, so the
+        # schema is built once and reused when the form is re-shown on error.
+        self._options_schema: vol.Schema | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -122,6 +152,15 @@ class AudacMTXOptionsFlow(config_entries.OptionsFlow):
         self,
         errors: dict[str, str] | None = None,
     ) -> FlowResult:
+        if self._options_schema is None:
+            self._options_schema = self._build_options_schema()
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self._options_schema,
+            errors=errors or {},
+        )
+
+    def _build_options_schema(self) -> vol.Schema:
         model = self._config_entry.data.get(CONF_MODEL, MODEL_MTX88)
         current_options = self._config_entry.options
 
@@ -131,28 +170,11 @@ class AudacMTXOptionsFlow(config_entries.OptionsFlow):
             # XMP44: Module selection, slot names and visibility
             slots_count = self._config_entry.data.get("slots", MODEL_SLOTS.get(model, 4))
 
-            module_options = [
-                selector.SelectOptionDict(value="0", label="Kein Modul"),
-                selector.SelectOptionDict(value="1", label="DMP40 (DAB/DAB+ & FM Tuner)"),
-                selector.SelectOptionDict(value="2", label="TMP40 (FM Tuner)"),
-                selector.SelectOptionDict(value="3", label="MMP40 (Media Player/Recorder)"),
-                selector.SelectOptionDict(value="4", label="IMP40 (Internet Radio)"),
-                selector.SelectOptionDict(value="6", label="FMP40 (Voice File)"),
-                selector.SelectOptionDict(value="8", label="BMP40 (Bluetooth)"),
-                selector.SelectOptionDict(value="9", label="NMP40 (Network Player)"),
-            ]
-
             for i in range(1, slots_count + 1):
                 default_module = current_options.get(f"slot_{i}_module", "0")
                 if isinstance(default_module, int):
                     default_module = str(default_module)
-                schema_dict[vol.Optional(f"slot_{i}_module", default=default_module)] = selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=module_options,
-                        multiple=False,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                )
+                schema_dict[vol.Optional(f"slot_{i}_module", default=default_module)] = XMP_MODULE_SELECTOR
                 default_name = current_options.get(f"slot_{i}_name", f"Slot {i}")
                 schema_dict[vol.Optional(f"slot_{i}_name", default=default_name)] = str
                 default_visible = current_options.get(f"slot_{i}_visible", True)
@@ -161,11 +183,7 @@ class AudacMTXOptionsFlow(config_entries.OptionsFlow):
                 # FMP40-specific: trigger count and individual trigger names
                 if default_module == "6":
                     default_triggers = current_options.get(f"slot_{i}_triggers", 0)
-                    schema_dict[vol.Optional(f"slot_{i}_triggers", default=default_triggers)] = selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0, max=50, step=1, mode=selector.NumberSelectorMode.BOX,
-                        )
-                    )
+                    schema_dict[vol.Optional(f"slot_{i}_triggers", default=default_triggers)] = FMP40_TRIGGER_COUNT_SELECTOR
                     # Individual name field per trigger (based on saved trigger count)
                     try:
                         saved_triggers = int(current_options.get(f"slot_{i}_triggers", 0))
@@ -177,10 +195,15 @@ class AudacMTXOptionsFlow(config_entries.OptionsFlow):
         else:
             # MTX: Zone names, visibility, coupling, and source configuration
             zones_count = MODEL_ZONES.get(model, 8)
+            # Each zone's label is needed once for its own name field and once
+            # in every other zone's coupling dropdown — look them up once.
+            zone_labels = {
+                j: current_options.get(f"zone_{j}_name", f"Zone {j}")
+                for j in range(1, zones_count + 1)
+            }
 
             for i in range(1, zones_count + 1):
-                default_name = current_options.get(f"zone_{i}_name", f"Zone {i}")
-                schema_dict[vol.Optional(f"zone_{i}_name", default=default_name)] = str
+                schema_dict[vol.Optional(f"zone_{i}_name", default=zone_labels[i])] = str
                 default_visible = current_options.get(f"zone_{i}_visible", True)
                 schema_dict[vol.Optional(f"zone_{i}_visible", default=default_visible)] = bool
 
@@ -198,11 +221,8 @@ class AudacMTXOptionsFlow(config_entries.OptionsFlow):
                 coupling_options = [
                     selector.SelectOptionDict(value="0", label="Keine Kopplung"),
                 ] + [
-                    selector.SelectOptionDict(
-                        value=str(j),
-                        label=current_options.get(f"zone_{j}_name", f"Zone {j}"),
-                    )
-                    for j in range(1, zones_count + 1) if j != i
+                    selector.SelectOptionDict(value=str(j), label=label)
+                    for j, label in zone_labels.items() if j != i
                 ]
                 schema_dict[vol.Optional(f"zone_{i}_link", default=default_link)] = selector.SelectSelector(
                     selector.SelectSelectorConfig(
@@ -212,15 +232,10 @@ class AudacMTXOptionsFlow(config_entries.OptionsFlow):
                     )
                 )
 
-            for input_id, default_label in INPUT_NAMES.items():
-                current_label = current_options.get(f"source_{input_id}_name", default_label)
-                schema_dict[vol.Optional(f"source_{input_id}_name", default=current_label)] = str
-                default_visible = input_id != 0
-                default_visible = current_options.get(f"source_{input_id}_visible", default_visible)
-                schema_dict[vol.Optional(f"source_{input_id}_visible", default=default_visible)] = bool
+            for _, name_key, visible_key, default_label, default_visible in SOURCE_OPTION_KEYS:
+                current_label = current_options.get(name_key, default_label)
+                schema_dict[vol.Optional(name_key, default=current_label)] = str
+                current_visible = current_options.get(visible_key, default_visible)
+                schema_dict[vol.Optional(visible_key, default=current_visible)] = bool
 
-        return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema(schema_dict),
-            errors=errors or {},
-        )
+        return vol.Schema(schema_dict)
@@ -1,4 +1,7 @@
 """Constants for the Audac MTX integration."""
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 
 DOMAIN = "audac_mtx"
 DEFAULT_PORT = 5001
@@ -37,14 +40,28 @@ MODEL_ADDRESS = {
     MODEL_XMP44: "D001",
 }
 
+# Read-only fallback for zones/slots missing from the coordinator data, so
+# lookups don't allocate a new empty dict each time.
+EMPTY_DATA = MappingProxyType({})
+
+# Every model with zones is an MTX matrix.
+MTX_MODELS = frozenset(MODEL_ZONES)
+
 def is_mtx_model(model: str) -> bool:
     """Check if the model is an MTX audio matrix."""
-    return model in (MODEL_MTX48, MODEL_MTX88)
+    return model in MTX_MODELS
 
 def is_xmp_model(model: str) -> bool:
     """Check if the model is an XMP modular audio system."""
     return model == MODEL_XMP44
 
+def get_zones_count(data: Mapping[str, Any]) -> int:
+    """Return the zone count stored in a config entry's data."""
+    zones = data.get("zones")
+    if zones is not None:
+        return zones
+    return MODEL_ZONES.get(data.get(CONF_MODEL, MODEL_MTX88), 8)
+
 INPUT_NAMES = {
     0: "Off",
     1: "Mic 1",
@@ -57,6 +74,14 @@ INPUT_NAMES = {
     8: "Wall Panel (WMI)",
 }
 
+# (input_id, name option key, visible option key, default name, default visible)
+# per input, so option lookups don't rebuild the key strings every time.
+# Source 0 (Off) is hidden by default; all others are visible by default.
+SOURCE_OPTION_KEYS = tuple(
+    (input_id, f"source_{input_id}_name", f"source_{input_id}_visible", default_name, input_id != 0)
+    for input_id, default_name in INPUT_NAMES.items()
+)
+
 BASS_TREBLE_MAP = {
     0: -14,
     1: -12,
@@ -81,11 +106,8 @@ VOLUME_MAX = 70
 
 def get_source_names(options: dict, visible_only: bool = True) -> dict[int, str]:
     result = {}
-    for input_id, default_name in INPUT_NAMES.items():
-        if visible_only:
-            # source_0 (Off) is hidden by default; all others visible by default
-            default_visible = input_id != 0
-            if not options.get(f"source_{input_id}_visible", default_visible):
-                continue
-        result[input_id] = options.get(f"source_{input_id}_name", default_name)
+    for input_id, name_key, visible_key, default_name, default_visible in SOURCE_OPTION_KEYS:
+        if visible_only and not options.get(visible_key, default_visible):
+            continue
+        result[input_id] = options.get(name_key, default_name)
     return result
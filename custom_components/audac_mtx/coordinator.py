@@ -7,10 +7,11 @@ from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, MODEL_ZONES
+from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, MODEL_NAMES, get_source_names, get_zones_count
 from .mtx_client import MTXClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,6 +22,10 @@ SCAN_INTERVAL = timedelta(seconds=60)
 # Slower polling when device is unreachable — retry every 3 minutes.
 SCAN_INTERVAL_SLOW = timedelta(seconds=180)
 
+# Delay before a refresh requested after a command; a burst of commands
+# (e.g. dragging a slider) collapses into one poll once the MTX has settled.
+REQUEST_REFRESH_COOLDOWN = 0.5
+
 # Hard timeout for a complete coordinator update cycle.
 UPDATE_TIMEOUT = 55.0
 
@@ -41,15 +46,47 @@ class AudacMTXCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            # Idle polls return equal data; only notify entities on a real change.
+            always_update=False,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False,
+            ),
         )
         self.entry = entry
         self.client = MTXClient(
             host=entry.data["host"],
             port=entry.data.get("port", 5001),
         )
-        model = entry.data.get(CONF_MODEL, MODEL_MTX88)
-        self._zones_count = entry.data.get("zones", MODEL_ZONES.get(model, 8))
+        self._zones_count = get_zones_count(entry.data)
+        # Every zone entity and MTX button belongs to this one device.
+        self.device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": entry.data.get("name", "Audac MTX"),
+            "manufacturer": "Audac",
+            "model": MODEL_NAMES.get(entry.data.get(CONF_MODEL, MODEL_MTX88), "MTX"),
+        }
         self._consecutive_update_failures = 0
+        # Source labels only change through the options flow, which reloads
+        # the entry — resolve them once and share them with all zone entities.
+        self.source_names = get_source_names(entry.options)
+        self.all_source_names = get_source_names(entry.options, visible_only=False)
+        # Shared by the zone entities: label -> input id for source selection
+        # (first label wins on duplicates) and the visible labels in order.
+        self.source_ids = {name: input_id for input_id, name in reversed(self.source_names.items())}
+        self.source_options = list(self.source_names.values())
+        # Options this coordinator was built with (used to detect live-only changes).
+        self.options_snapshot = dict(entry.options)
+
+    @callback
+    def async_apply_zone_value(self, zone: int, key: str, value: Any) -> None:
+        """Show a value the device just accepted before the next poll confirms it.
+
+        The data is replaced (not mutated), so the follow-up poll is compared
+        against the optimistic value and reverts it if the device disagrees.
+        """
+        if not self.data or zone not in self.data:
+            return
+        self.async_set_updated_data({**self.data, zone: {**self.data[zone], key: value}})
 
     def _get_zone_links(self) -> dict[int, int]:
         """Return {slave_zone: master_zone} mapping from current options.
@@ -1,12 +1,14 @@
 """Base entity for Audac MTX integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, MODEL_NAMES
+from .const import EMPTY_DATA
 from .coordinator import AudacMTXCoordinator
 
 
@@ -17,20 +19,33 @@ class AudacMTXBaseEntity(CoordinatorEntity[AudacMTXCoordinator]):
         super().__init__(coordinator)
         self._zone = zone
         self._entry = entry
-        model = entry.data.get(CONF_MODEL, MODEL_MTX88)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.data.get("name", "Audac MTX"),
-            "manufacturer": "Audac",
-            "model": MODEL_NAMES.get(model, "MTX"),
-        }
+        self._attr_device_info = coordinator.device_info
+        self._available = self._compute_available()
 
     @property
-    def _zone_data(self) -> dict[str, Any]:
+    def _zone_data(self) -> Mapping[str, Any]:
         if self.coordinator.data and self._zone in self.coordinator.data:
             return self.coordinator.data[self._zone]
-        return {}
+        return EMPTY_DATA
+
+    def _compute_available(self) -> bool:
+        return self.coordinator.last_update_success and bool(self._zone_data)
+
+    def _update_attrs(self) -> None:
+        """Copy this entity's state from the zone data into its _attr_* fields.
+
+        Subclasses call this at the end of __init__; it runs again on every
+        coordinator update so state reads never walk the coordinator data.
+        """
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Availability and state only change when the coordinator updates;
+        # cache them so every state write doesn't redo the lookups.
+        self._available = self._compute_available()
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
-        return self.coordinator.last_update_success and bool(self._zone_data)
+        return self._available
@@ -1,11 +1,22 @@
 """Shared helper utilities for Audac MTX integration."""
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity_registry import RegistryEntryHider
 
+from .const import DOMAIN, get_zones_count
+
+# Matches the per-zone unique_id suffixes listed in _async_update_zone_visibility.
+_ZONE_UID_RE = re.compile(r"_zone_(\d+)(?:_volume|_mute|_source|_active_source)?$")
+
 
 async def _async_update_zone_visibility(
     hass: HomeAssistant, entry: ConfigEntry, zones_count: int, domain: str
@@ -25,6 +36,7 @@ async def _async_update_zone_visibility(
     Visibility is controlled via entity registry (same as native HA entities).
     """
     ent_reg = er.async_get(hass)
+    visible_by_zone: dict[int, bool] = {}
 
     for zone in range(1, zones_count + 1):
         zone_visible = entry.options.get(f"zone_{zone}_visible", True)
@@ -50,28 +62,36 @@ async def _async_update_zone_visibility(
         else:
             master = entry.options.get(f"zone_{zone}_linked_to", 0)
         is_slave = master != 0 and master != zone
-        should_be_visible = zone_visible and not is_slave
+        visible_by_zone[zone] = zone_visible and not is_slave
 
-        suffixes = (
-            f"_zone_{zone}",
-            f"_zone_{zone}_volume",
-            f"_zone_{zone}_mute",
-            f"_zone_{zone}_source",
-            f"_zone_{zone}_active_source",
-        )
+    # Single pass over this entry's registry entries (instead of one full
+    # registry scan per zone).
+    for ent_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
+        match = _ZONE_UID_RE.search(ent_entry.unique_id or "")
+        if match is None:
+            continue
+        should_be_visible = visible_by_zone.get(int(match.group(1)))
+        if should_be_visible is None:
+            continue
 
-        for ent_entry in list(ent_reg.entities.values()):
-            if ent_entry.config_entry_id != entry.entry_id:
-                continue
-            uid = ent_entry.unique_id or ""
-            if not any(uid.endswith(s) for s in suffixes):
-                continue
+        currently_hidden = ent_entry.hidden_by == RegistryEntryHider.INTEGRATION
+        if not should_be_visible and not currently_hidden:
+            ent_reg.async_update_entity(
+                ent_entry.entity_id,
+                hidden_by=RegistryEntryHider.INTEGRATION,
+            )
+        elif should_be_visible and currently_hidden:
+            ent_reg.async_update_entity(ent_entry.entity_id, hidden_by=None)
 
-            currently_hidden = ent_entry.hidden_by == RegistryEntryHider.INTEGRATION
-            if not should_be_visible and not currently_hidden:
-                ent_reg.async_update_entity(
-                    ent_entry.entity_id,
-                    hidden_by=RegistryEntryHider.INTEGRATION,
-                )
-            elif should_be_visible and currently_hidden:
-                ent_reg.async_update_entity(ent_entry.entity_id, hidden_by=None)
+
+async def _async_setup_zone_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: Any,
+    async_add_entities: AddEntitiesCallback,
+    entity_cls: Callable[[Any, int, ConfigEntry], Entity],
+) -> None:
+    """Add one entity_cls per MTX zone, then apply the zone visibility options."""
+    zones_count = get_zones_count(entry.data)
+    async_add_entities(entity_cls(coordinator, zone, entry) for zone in range(1, zones_count + 1))
+    await _async_update_zone_visibility(hass, entry, zones_count, DOMAIN)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
@@ -16,7 +17,7 @@ from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, MODEL_ZONES, get_source_names, is_xmp_model
+from .const import DOMAIN, CONF_MODEL, EMPTY_DATA, MODEL_MTX88, get_zones_count, is_xmp_model
 from .coordinator import AudacMTXCoordinator
 from .xmp44_coordinator import XMP44Coordinator
 from .xmp44_client import (
@@ -25,10 +26,13 @@ from .xmp44_client import (
     MODULE_BMP40, MODULE_IMP40,
 )
 from .entity import AudacMTXBaseEntity
-from .helpers import _async_update_zone_visibility
+from .helpers import _async_setup_zone_entities
 
 _LOGGER = logging.getLogger(__name__)
 
+# Raw bass/treble step (0–14, 7 = flat), shared by both entity services.
+TONE_STEP = vol.All(int, vol.Range(min=0, max=14))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,23 +54,17 @@ async def _setup_mtx(
     coordinator: AudacMTXCoordinator,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    zones_count = entry.data.get("zones", MODEL_ZONES.get(entry.data.get(CONF_MODEL, MODEL_MTX88), 8))
-
-    entities = []
-    for zone in range(1, zones_count + 1):
-        entities.append(AudacMTXZone(coordinator, zone, entry))
-    async_add_entities(entities)
-    await _async_update_zone_visibility(hass, entry, zones_count, DOMAIN)
+    await _async_setup_zone_entities(hass, entry, coordinator, async_add_entities, AudacMTXZone)
 
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
         "set_bass",
-        {vol.Required("bass"): vol.All(int, vol.Range(min=0, max=14))},
+        {vol.Required("bass"): TONE_STEP},
         "async_set_bass",
     )
     platform.async_register_entity_service(
         "set_treble",
-        {vol.Required("treble"): vol.All(int, vol.Range(min=0, max=14))},
+        {vol.Required("treble"): TONE_STEP},
         "async_set_treble",
     )
     platform.async_register_entity_service(
@@ -93,8 +91,8 @@ class AudacMTXZone(AudacMTXBaseEntity, MediaPlayerEntity):
         super().__init__(coordinator, zone, entry)
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone}"
         self._attr_name = entry.options.get(f"zone_{zone}_name", f"Zone {zone}")
-        self._source_names = get_source_names(entry.options)
-        self._attr_source_list = list(self._source_names.values())
+        self._source_names = coordinator.source_names
+        self._attr_source_list = coordinator.source_options
 
     def _get_slave_zones(self) -> list[int]:
         """Return zone numbers that are linked/slaved to this master zone.
@@ -104,9 +102,7 @@ class AudacMTXZone(AudacMTXBaseEntity, MediaPlayerEntity):
         - zone_z_links: List[str]  (old: checkbox multi-select)
         - zone_z_linked_to: int    (legacy)
         """
-        from .const import MODEL_MTX88, MODEL_ZONES, CONF_MODEL
-        model = self._entry.data.get(CONF_MODEL, MODEL_MTX88)
-        zones_count = self._entry.data.get("zones", MODEL_ZONES.get(model, 8))
+        zones_count = get_zones_count(self._entry.data)
         result = []
         for z in range(1, zones_count + 1):
             if z == self._zone:
@@ -224,17 +220,18 @@ class AudacMTXZone(AudacMTXBaseEntity, MediaPlayerEntity):
         await self.coordinator.async_request_refresh()
 
     async def async_mute_volume(self, mute: bool) -> None:
-        await self.coordinator.client.set_mute(self._zone, mute)
+        if await self.coordinator.client.set_mute(self._zone, mute):
+            self.coordinator.async_apply_zone_value(self._zone, "mute", mute)
         await self._mirror_to_slaves(lambda z: self.coordinator.client.set_mute(z, mute))
         await self.coordinator.async_request_refresh()
 
     async def async_select_source(self, source: str) -> None:
-        for input_id, name in self._source_names.items():
-            if name == source:
-                await self.coordinator.client.set_routing(self._zone, input_id)
-                await self._mirror_to_slaves(lambda z: self.coordinator.client.set_routing(z, input_id))
-                await self.coordinator.async_request_refresh()
-                return
+        input_id = self.coordinator.source_ids.get(source)
+        if input_id is None:
+            return
+        await self.coordinator.client.set_routing(self._zone, input_id)
+        await self._mirror_to_slaves(lambda z: self.coordinator.client.set_routing(z, input_id))
+        await self.coordinator.async_request_refresh()
 
     async def async_set_bass(self, bass: int) -> None:
         await self.coordinator.client.set_bass(self._zone, bass)
@@ -343,10 +340,10 @@ class AudacXMP44Slot(CoordinatorEntity, MediaPlayerEntity):
         self._source_pointer_map: dict[str, str] = {}
 
     @property
-    def _slot_data(self) -> dict[str, Any]:
+    def _slot_data(self) -> Mapping[str, Any]:
         if self.coordinator.data and self._slot in self.coordinator.data:
             return self.coordinator.data[self._slot]
-        return {}
+        return EMPTY_DATA
 
     @property
     def state(self) -> MediaPlayerState:
@@ -13,8 +13,8 @@ import asyncio
 import logging
 from typing import Any
 
-from .audac_client import AudacClient, INTER_COMMAND_DELAY
-from .const import DEFAULT_PORT, DEFAULT_SOURCE, INPUT_NAMES, BASS_TREBLE_MAP
+from .audac_client import AudacClient
+from .const import DEFAULT_PORT, DEFAULT_SOURCE, BASS_TREBLE_MAP, MODEL_ZONES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +23,14 @@ _LOGGER = logging.getLogger(__name__)
 # for occasional retries and slow responses without false timeouts.
 GET_ALL_ZONES_TIMEOUT = 45.0
 
+# Per-zone command names are constant; build them once instead of
+# formatting a new string on every poll / user action.
+_ZONES = range(1, max(MODEL_ZONES.values()) + 1)
+_ZONE_INFO_CMDS = {zone: f"GZI0{zone}" for zone in _ZONES}
+_SET_VOLUME_CMDS = {zone: f"SV{zone}" for zone in _ZONES}
+_SET_ROUTING_CMDS = {zone: f"SR{zone}" for zone in _ZONES}
+_SET_MUTE_CMDS = {zone: f"SM0{zone}" for zone in _ZONES}
+
 
 class MTXClient(AudacClient):
     """Client for Audac MTX48/MTX88 audio matrices."""
@@ -31,11 +39,23 @@ class MTXClient(AudacClient):
 
     def __init__(self, host: str, port: int = DEFAULT_PORT, source: str = DEFAULT_SOURCE) -> None:
         super().__init__(host, port, source)
+        # Firmware version never changes while the device is running; it is
+        # cleared on disconnect in case a firmware update or another unit
+        # is behind the host when we reconnect.
+        self._version: str | None = None
+
+    async def disconnect(self) -> None:
+        self._version = None
+        await super().disconnect()
+
+    def _force_disconnect(self) -> None:
+        self._version = None
+        super()._force_disconnect()
 
     # ── Zone queries ────────────────────────────────────────────────
 
     async def get_zone_info(self, zone: int) -> dict[str, Any]:
-        resp = await self._send_and_receive(f"GZI0{zone}")
+        resp = await self._send_and_receive(_ZONE_INFO_CMDS[zone])
         data = self._get_data_field(resp)
         if not data or data == "+":
             return {}
@@ -44,19 +64,15 @@ class MTXClient(AudacClient):
             _LOGGER.warning("Zone %d: expected >=5 fields, got %d: %s", zone, len(values), data)
             return {}
         try:
-            volume_raw = int(values[0])
-            routing = int(values[1])
-            mute_raw = int(values[2])
-            bass_raw = int(values[3])
-            treble_raw = int(values[4])
-        except (ValueError, IndexError) as err:
+            # int() tolerates surrounding whitespace, so no separate strip pass.
+            volume_raw, routing, mute_raw, bass_raw, treble_raw = map(int, values[:5])
+        except ValueError as err:
             _LOGGER.warning("Zone %d parse error: %s", zone, err)
             return {}
         return {
             "volume": volume_raw,
             "volume_db": -volume_raw,
             "routing": routing,
-            "source_name": INPUT_NAMES.get(routing, f"Input {routing}"),
             "mute": mute_raw != 0,
             "bass": bass_raw,
             "bass_db": BASS_TREBLE_MAP.get(bass_raw, 0),
@@ -82,9 +98,8 @@ class MTXClient(AudacClient):
                 "get_all_zones() exceeded %.0fs total timeout — forcing disconnect",
                 GET_ALL_ZONES_TIMEOUT,
             )
-            self._writer = None
-            self._reader = None
-            self._consecutive_failures += 1
+            self._force_disconnect()
+            self._record_failure()
             raise ConnectionError("get_all_zones timed out") from None
 
     async def _get_all_zones_inner(self, zones_count: int, previous: dict[int, dict[str, Any]] | None = None) -> dict[int, dict[str, Any]]:
@@ -107,7 +122,6 @@ class MTXClient(AudacClient):
                 if previous and zone in previous:
                     zones[zone] = previous[zone]
                     failed_zones.append(zone)
-            await asyncio.sleep(INTER_COMMAND_DELAY)
 
         if failed_zones:
             _LOGGER.warning(
@@ -121,7 +135,7 @@ class MTXClient(AudacClient):
 
     async def set_volume(self, zone: int, volume: int) -> bool:
         volume = max(0, min(70, volume))
-        resp = await self._send_and_receive(f"SV{zone}", str(volume))
+        resp = await self._send_and_receive(_SET_VOLUME_CMDS[zone], str(volume))
         return self._is_success(resp)
 
     async def set_volume_up(self, zone: int) -> bool:
@@ -133,7 +147,7 @@ class MTXClient(AudacClient):
         return self._is_success(resp)
 
     async def set_routing(self, zone: int, input_id: int) -> bool:
-        resp = await self._send_and_receive(f"SR{zone}", str(input_id))
+        resp = await self._send_and_receive(_SET_ROUTING_CMDS[zone], str(input_id))
         return self._is_success(resp)
 
     async def set_routing_up(self, zone: int) -> bool:
@@ -155,7 +169,7 @@ class MTXClient(AudacClient):
         return self._is_success(resp)
 
     async def set_mute(self, zone: int, mute: bool) -> bool:
-        resp = await self._send_and_receive(f"SM0{zone}", "1" if mute else "0")
+        resp = await self._send_and_receive(_SET_MUTE_CMDS[zone], "1" if mute else "0")
         return self._is_success(resp)
 
     async def save(self) -> bool:
@@ -167,9 +181,15 @@ class MTXClient(AudacClient):
         return self._is_success(resp)
 
     async def get_version(self) -> str:
+        """Return the firmware version (queried once, then cached)."""
+        if self._version is not None:
+            return self._version
         resp = await self._send_and_receive("GSV", "0")
         data = self._get_data_field(resp)
-        return data if data and data != "+" else "Unknown"
+        if not data or data == "+":
+            return "Unknown"
+        self._version = data
+        return data
 
     async def get_zone_volume(self, zone: int) -> int | None:
         return await self._get_single_value(f"GV0{zone}")
@@ -9,10 +9,10 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, MODEL_ZONES
+from .const import DOMAIN
 from .coordinator import AudacMTXCoordinator
 from .entity import AudacMTXBaseEntity
-from .helpers import _async_update_zone_visibility
+from .helpers import _async_setup_zone_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,14 +23,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: AudacMTXCoordinator = hass.data[DOMAIN][entry.entry_id]
-    model = entry.data.get(CONF_MODEL, MODEL_MTX88)
-    zones_count = entry.data.get("zones", MODEL_ZONES.get(model, 8))
-
-    entities = []
-    for zone in range(1, zones_count + 1):
-        entities.append(AudacMTXVolumeNumber(coordinator, zone, entry))
-    async_add_entities(entities)
-    await _async_update_zone_visibility(hass, entry, zones_count, DOMAIN)
+    await _async_setup_zone_entities(hass, entry, coordinator, async_add_entities, AudacMTXVolumeNumber)
 
 
 class AudacMTXVolumeNumber(AudacMTXBaseEntity, NumberEntity):
@@ -47,16 +40,14 @@ class AudacMTXVolumeNumber(AudacMTXBaseEntity, NumberEntity):
         zone_name = entry.options.get(f"zone_{zone}_name", f"Zone {zone}")
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone}_volume"
         self._attr_name = f"{zone_name} Volume"
+        self._update_attrs()
 
-    @property
-    def native_value(self) -> float | None:
-        data = self._zone_data
-        if not data:
-            return None
-        volume_raw = data.get("volume")
+    def _update_attrs(self) -> None:
+        volume_raw = self._zone_data.get("volume")
         if volume_raw is None:
-            return None
-        return round((1.0 - (volume_raw / 70.0)) * 100)
+            self._attr_native_value = None
+        else:
+            self._attr_native_value = round((1.0 - (volume_raw / 70.0)) * 100)
 
     async def async_set_native_value(self, value: float) -> None:
         volume_raw = int((1.0 - (value / 100.0)) * 70)
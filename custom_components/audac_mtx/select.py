@@ -10,13 +10,16 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, INPUT_NAMES, CONF_MODEL, MODEL_MTX88, MODEL_ZONES, get_source_names
+from .const import DOMAIN, INPUT_NAMES
 from .coordinator import AudacMTXCoordinator
 from .entity import AudacMTXBaseEntity
-from .helpers import _async_update_zone_visibility
+from .helpers import _async_setup_zone_entities
 
 _LOGGER = logging.getLogger(__name__)
 
+# Default labels resolve even when the input is hidden from the options.
+_INPUT_IDS = {name: input_id for input_id, name in INPUT_NAMES.items()}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,14 +27,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: AudacMTXCoordinator = hass.data[DOMAIN][entry.entry_id]
-    model = entry.data.get(CONF_MODEL, MODEL_MTX88)
-    zones_count = entry.data.get("zones", MODEL_ZONES.get(model, 8))
-
-    entities = []
-    for zone in range(1, zones_count + 1):
-        entities.append(AudacMTXSourceSelect(coordinator, zone, entry))
-    async_add_entities(entities)
-    await _async_update_zone_visibility(hass, entry, zones_count, DOMAIN)
+    await _async_setup_zone_entities(hass, entry, coordinator, async_add_entities, AudacMTXSourceSelect)
 
 
 class AudacMTXSourceSelect(AudacMTXBaseEntity, SelectEntity):
@@ -43,42 +39,31 @@ class AudacMTXSourceSelect(AudacMTXBaseEntity, SelectEntity):
         zone_name = entry.options.get(f"zone_{zone}_name", f"Zone {zone}")
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone}_source"
         self._attr_name = f"{zone_name} Source"
-        self._source_names = get_source_names(entry.options)
-        self._attr_options = list(self._source_names.values())
-
-    @property
-    def options(self) -> list[str]:
-        opts = list(self._source_names.values())
-        data = self._zone_data
-        if data:
-            routing = data.get("routing", 0)
-            current = self._source_names.get(routing)
-            if current is None:
-                fallback = INPUT_NAMES.get(routing, f"Input {routing}")
-                if fallback not in opts:
-                    opts.append(fallback)
-        return opts
+        self._source_names = coordinator.source_names
+        self._base_options = coordinator.source_options
+        self._update_attrs()
 
-    @property
-    def current_option(self) -> str | None:
+    def _update_attrs(self) -> None:
         data = self._zone_data
-        if not data:
-            return None
         routing = data.get("routing")
         if routing is None:
-            return None
-        if routing in self._source_names:
-            return self._source_names[routing]
-        return INPUT_NAMES.get(routing, f"Input {routing}")
+            self._attr_current_option = None
+        elif routing in self._source_names:
+            self._attr_current_option = self._source_names[routing]
+        else:
+            self._attr_current_option = INPUT_NAMES.get(routing, f"Input {routing}")
+        # A zone routed to a hidden input still needs that input in the list.
+        current = self._attr_current_option
+        if current is not None and current not in self._base_options:
+            self._attr_options = [*self._base_options, current]
+        else:
+            self._attr_options = self._base_options
 
     async def async_select_option(self, option: str) -> None:
-        for input_id, name in self._source_names.items():
-            if name == option:
-                await self.coordinator.client.set_routing(self._zone, input_id)
-                await self.coordinator.async_request_refresh()
-                return
-        for input_id, name in INPUT_NAMES.items():
-            if name == option:
-                await self.coordinator.client.set_routing(self._zone, input_id)
-                await self.coordinator.async_request_refresh()
-                return
+        input_id = self.coordinator.source_ids.get(option)
+        if input_id is None:
+            input_id = _INPUT_IDS.get(option)
+        if input_id is None:
+            return
+        await self.coordinator.client.set_routing(self._zone, input_id)
+        await self.coordinator.async_request_refresh()
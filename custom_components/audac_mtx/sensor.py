@@ -1,20 +1,22 @@
-"""Sensor entities for Audac MTX active source and XMP44 BMP40 Bluetooth."""
+"""Sensor entities for Audac MTX active source and XMP44 module slots."""
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, MODEL_ZONES, get_source_names, is_xmp_model
+from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, is_xmp_model
 from .coordinator import AudacMTXCoordinator
 from .entity import AudacMTXBaseEntity
-from .helpers import _async_update_zone_visibility
+from .helpers import _async_setup_zone_entities
+from .xmp44_client import MODULE_BMP40, MODULE_NMP40, MODULE_DMP40, MODULES_WITH_TUNER
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +29,53 @@ PAIRING_STATE_MAP = {
 }
 
 
+class SlotSensorSpec(NamedTuple):
+    """One XMP44 slot sensor that shows a single field of the slot data."""
+
+    module: str  # unique_id part before "_slot<n>_"
+    field: str  # unique_id part after "_slot<n>_"
+    name: str
+    key: str  # key in the coordinator's slot data
+    icon: str
+    unit: str | None = None
+    category: EntityCategory | None = None
+    convert: Callable[[Any], Any] | None = None
+    slot_attribute: bool = False  # expose slot_number as a state attribute
+
+
+BMP40_SENSORS = (
+    SlotSensorSpec(
+        "bmp40", "pairing_state", "Pairing Status", "pairing_state", "mdi:bluetooth-settings",
+        category=EntityCategory.DIAGNOSTIC,
+        convert=lambda state: PAIRING_STATE_MAP.get(state, f"Unbekannt ({state})"),
+    ),
+)
+
+NMP40_SENSORS = (
+    SlotSensorSpec("nmp40", "player_name", "Player Name", "player_name", "mdi:speaker-wireless"),
+    SlotSensorSpec(
+        "nmp40", "ip", "IP-Adresse", "player_ip", "mdi:ip-network",
+        category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+TUNER_SENSORS = (
+    SlotSensorSpec(
+        "tuner", "frequency", "Frequenz", "frequency", "mdi:radio-tower",
+        unit="MHz", convert=lambda freq: round(freq / 100, 2), slot_attribute=True,
+    ),
+    SlotSensorSpec("tuner", "program", "Sender", "program_name", "mdi:radio", slot_attribute=True),
+    SlotSensorSpec(
+        "tuner", "signal", "Signalstärke", "signal_strength", "mdi:signal",
+        unit="%", category=EntityCategory.DIAGNOSTIC, slot_attribute=True,
+    ),
+)
+
+DMP40_SENSORS = (
+    SlotSensorSpec("tuner", "band", "Band", "band", "mdi:radio-fm", slot_attribute=True),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -47,13 +96,7 @@ async def _setup_mtx_sensors(
     coordinator: AudacMTXCoordinator,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    model = entry.data.get(CONF_MODEL, MODEL_MTX88)
-    zones_count = entry.data.get("zones", MODEL_ZONES.get(model, 8))
-    entities = []
-    for zone in range(1, zones_count + 1):
-        entities.append(AudacMTXSourceSensor(coordinator, zone, entry))
-    async_add_entities(entities)
-    await _async_update_zone_visibility(hass, entry, zones_count, DOMAIN)
+    await _async_setup_zone_entities(hass, entry, coordinator, async_add_entities, AudacMTXSourceSensor)
 
 
 async def _setup_xmp44_sensors(
@@ -61,31 +104,26 @@ async def _setup_xmp44_sensors(
     coordinator,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    from .xmp44_client import MODULE_BMP40, MODULE_NMP40, MODULE_DMP40, MODULE_TMP40, MODULE_MMP40, MODULES_WITH_TUNER
     slots_count = entry.data.get("slots", 4)
     entities = []
 
+    # Parsed once from the slot options by the coordinator.
+    module_types = coordinator.client.module_types
+
     for slot in range(1, slots_count + 1):
-        module_str = entry.options.get(f"slot_{slot}_module", "0")
-        try:
-            module_type = int(module_str)
-        except (ValueError, TypeError):
-            module_type = 0
+        module_type = module_types.get(slot, 0)
 
+        specs: tuple[SlotSensorSpec, ...] = ()
         if module_type == MODULE_BMP40:
             entities.append(BMP40ConnectedDeviceSensor(coordinator, entry, slot))
-            entities.append(BMP40PairingStateSensor(coordinator, entry, slot))
-
+            specs += BMP40_SENSORS
         if module_type == MODULE_NMP40:
-            entities.append(NMP40PlayerNameSensor(coordinator, entry, slot))
-            entities.append(NMP40IPAddressSensor(coordinator, entry, slot))
-
+            specs += NMP40_SENSORS
         if module_type in MODULES_WITH_TUNER:
-            entities.append(TunerFrequencySensor(coordinator, entry, slot))
-            entities.append(TunerProgramNameSensor(coordinator, entry, slot))
-            entities.append(TunerSignalStrengthSensor(coordinator, entry, slot))
+            specs += TUNER_SENSORS
             if module_type == MODULE_DMP40:
-                entities.append(TunerBandSensor(coordinator, entry, slot))
+                specs += DMP40_SENSORS
+        entities.extend(XMP44SlotSensor(coordinator, entry, slot, spec) for spec in specs)
 
     if entities:
         async_add_entities(entities)
@@ -100,24 +138,20 @@ class AudacMTXSourceSensor(AudacMTXBaseEntity, SensorEntity):
         zone_name = entry.options.get(f"zone_{zone}_name", f"Zone {zone}")
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone}_active_source"
         self._attr_name = f"{zone_name} Active Source"
-        self._source_names = get_source_names(entry.options, visible_only=False)
+        self._source_names = coordinator.all_source_names
+        self._update_attrs()
 
-    @property
-    def native_value(self) -> str | None:
+    def _update_attrs(self) -> None:
         data = self._zone_data
-        if not data:
-            return None
         routing = data.get("routing")
         if routing is None:
-            return None
-        return self._source_names.get(routing, f"Input {routing}")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        data = self._zone_data
+            self._attr_native_value = None
+        else:
+            self._attr_native_value = self._source_names.get(routing, f"Input {routing}")
         if not data:
-            return {}
-        return {
+            self._attr_extra_state_attributes = {}
+            return
+        self._attr_extra_state_attributes = {
             "routing_id": data.get("routing", 0),
             "volume_raw": data.get("volume", 70),
             "volume_db": data.get("volume_db", -70),
@@ -158,9 +192,8 @@ class BMP40ConnectedDeviceSensor(CoordinatorEntity, SensorEntity):
             return "Nicht verbunden"
         # Parse: "number^name^address"
         parts = connected.split("^")
-        if len(parts) >= 2 and parts[1].strip():
-            return parts[1].strip()
-        return "Nicht verbunden"
+        name = parts[1].strip() if len(parts) >= 2 else ""
+        return name or "Nicht verbunden"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -182,193 +215,39 @@ class BMP40ConnectedDeviceSensor(CoordinatorEntity, SensorEntity):
         return attrs
 
 
-class BMP40PairingStateSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing the BMP40 Bluetooth pairing state."""
-
-    _attr_has_entity_name = True
-    _attr_icon = "mdi:bluetooth-settings"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
-        super().__init__(coordinator)
-        self._slot = slot
-        self._attr_unique_id = f"{entry.entry_id}_bmp40_slot{slot}_pairing_state"
-        self._attr_name = "Pairing Status"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
-        }
-        self._extra_slot = slot
-
-    @property
-    def native_value(self) -> str | None:
-        data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        slot_data = data[self._slot]
-        state = slot_data.get("pairing_state")
-        if state is None:
-            return None
-        return PAIRING_STATE_MAP.get(state, f"Unbekannt ({state})")
-
-
 # ═══════════════════════════════════════════════════════════════════════
-# NMP40 Network Audio Player Sensors
+# XMP44 Slot Field Sensors (BMP40 pairing, NMP40, DMP40/TMP40 tuner)
 # ═══════════════════════════════════════════════════════════════════════
 
-class NMP40PlayerNameSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing the NMP40 player name."""
-
-    _attr_has_entity_name = True
-    _attr_icon = "mdi:speaker-wireless"
-
-    def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
-        super().__init__(coordinator)
-        self._slot = slot
-        self._attr_unique_id = f"{entry.entry_id}_nmp40_slot{slot}_player_name"
-        self._attr_name = "Player Name"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
-        }
-        self._extra_slot = slot
-
-    @property
-    def native_value(self) -> str | None:
-        data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        return data[self._slot].get("player_name")
-
-
-class NMP40IPAddressSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing the NMP40 IP address."""
+class XMP44SlotSensor(CoordinatorEntity, SensorEntity):
+    """Sensor showing one field of an XMP44 slot, described by a SlotSensorSpec."""
 
     _attr_has_entity_name = True
-    _attr_icon = "mdi:ip-network"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
+    def __init__(self, coordinator, entry: ConfigEntry, slot: int, spec: SlotSensorSpec) -> None:
         super().__init__(coordinator)
         self._slot = slot
-        self._attr_unique_id = f"{entry.entry_id}_nmp40_slot{slot}_ip"
-        self._attr_name = "IP-Adresse"
+        self._spec = spec
+        self._attr_unique_id = f"{entry.entry_id}_{spec.module}_slot{slot}_{spec.field}"
+        self._attr_name = spec.name
+        self._attr_icon = spec.icon
+        self._attr_native_unit_of_measurement = spec.unit
+        self._attr_entity_category = spec.category
+        if spec.slot_attribute:
+            self._attr_extra_state_attributes = {"slot_number": slot}
         self._attr_device_info = {
             "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
         }
-        self._extra_slot = slot
+        self._update_value()
 
-    @property
-    def native_value(self) -> str | None:
+    def _update_value(self) -> None:
         data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        return data[self._slot].get("player_ip")
-
-
-# ═══════════════════════════════════════════════════════════════════════
-# DMP40/TMP40 Tuner Sensors
-# ═══════════════════════════════════════════════════════════════════════
-
-class TunerFrequencySensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing the current tuner frequency in MHz."""
-
-    _attr_has_entity_name = True
-    _attr_icon = "mdi:radio-tower"
-    _attr_native_unit_of_measurement = "MHz"
-
-    def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
-        super().__init__(coordinator)
-        self._slot = slot
-        self._extra_slot = slot
-        self._attr_extra_state_attributes = {"slot_number": slot}
-        self._attr_unique_id = f"{entry.entry_id}_tuner_slot{slot}_frequency"
-        self._attr_name = "Frequenz"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
-        }
-
-    @property
-    def native_value(self) -> float | None:
-        data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        freq = data[self._slot].get("frequency")
-        if freq is None:
-            return None
-        return round(freq / 100, 2)
-
-
-class TunerProgramNameSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing the current station/program name."""
-
-    _attr_has_entity_name = True
-    _attr_icon = "mdi:radio"
-
-    def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
-        super().__init__(coordinator)
-        self._slot = slot
-        self._extra_slot = slot
-        self._attr_extra_state_attributes = {"slot_number": slot}
-        self._attr_unique_id = f"{entry.entry_id}_tuner_slot{slot}_program"
-        self._attr_name = "Sender"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
-        }
-
-    @property
-    def native_value(self) -> str | None:
-        data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        return data[self._slot].get("program_name")
-
-
-class TunerSignalStrengthSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing the tuner signal reception strength."""
-
-    _attr_has_entity_name = True
-    _attr_icon = "mdi:signal"
-    _attr_native_unit_of_measurement = "%"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
-        super().__init__(coordinator)
-        self._slot = slot
-        self._extra_slot = slot
-        self._attr_extra_state_attributes = {"slot_number": slot}
-        self._attr_unique_id = f"{entry.entry_id}_tuner_slot{slot}_signal"
-        self._attr_name = "Signalstärke"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
-        }
-
-    @property
-    def native_value(self) -> int | None:
-        data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        return data[self._slot].get("signal_strength")
-
-
-class TunerBandSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing the current band (DAB or FM) for DMP40."""
-
-    _attr_has_entity_name = True
-    _attr_icon = "mdi:radio-fm"
-
-    def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
-        super().__init__(coordinator)
-        self._slot = slot
-        self._extra_slot = slot
-        self._attr_extra_state_attributes = {"slot_number": slot}
-        self._attr_unique_id = f"{entry.entry_id}_tuner_slot{slot}_band"
-        self._attr_name = "Band"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
-        }
-
-    @property
-    def native_value(self) -> str | None:
-        data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        return data[self._slot].get("band")
+        value = data[self._slot].get(self._spec.key) if data and self._slot in data else None
+        if value is not None and self._spec.convert is not None:
+            value = self._spec.convert(value)
+        self._attr_native_value = value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_value()
+        super()._handle_coordinator_update()
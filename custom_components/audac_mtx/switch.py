@@ -7,14 +7,16 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, MODEL_ZONES, is_xmp_model
+from .const import DOMAIN, CONF_MODEL, MODEL_MTX88, is_xmp_model
 from .coordinator import AudacMTXCoordinator
 from .entity import AudacMTXBaseEntity
-from .helpers import _async_update_zone_visibility
+from .helpers import _async_setup_zone_entities
+from .xmp44_client import MODULE_BMP40, MODULE_MMP40, MODULES_WITH_TUNER
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,13 +41,7 @@ async def _setup_mtx_switches(
     coordinator: AudacMTXCoordinator,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    model = entry.data.get(CONF_MODEL, MODEL_MTX88)
-    zones_count = entry.data.get("zones", MODEL_ZONES.get(model, 8))
-    entities = []
-    for zone in range(1, zones_count + 1):
-        entities.append(AudacMTXMuteSwitch(coordinator, zone, entry))
-    async_add_entities(entities)
-    await _async_update_zone_visibility(hass, entry, zones_count, DOMAIN)
+    await _async_setup_zone_entities(hass, entry, coordinator, async_add_entities, AudacMTXMuteSwitch)
 
 
 async def _setup_xmp44_switches(
@@ -54,16 +50,14 @@ async def _setup_xmp44_switches(
     coordinator,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    from .xmp44_client import MODULE_BMP40, MODULE_DMP40, MODULE_TMP40, MODULE_MMP40, MODULES_WITH_TUNER
     slots_count = entry.data.get("slots", 4)
     entities = []
 
+    # Parsed once from the slot options by the coordinator.
+    module_types = coordinator.client.module_types
+
     for slot in range(1, slots_count + 1):
-        module_str = entry.options.get(f"slot_{slot}_module", "0")
-        try:
-            module_type = int(module_str)
-        except (ValueError, TypeError):
-            module_type = 0
+        module_type = module_types.get(slot, 0)
 
         if module_type == MODULE_BMP40:
             entities.append(BMP40PairingSwitch(coordinator, entry, slot))
@@ -87,136 +81,129 @@ class AudacMTXMuteSwitch(AudacMTXBaseEntity, SwitchEntity):
         zone_name = entry.options.get(f"zone_{zone}_name", f"Zone {zone}")
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone}_mute"
         self._attr_name = f"{zone_name} Mute"
+        self._update_attrs()
 
-    @property
-    def is_on(self) -> bool | None:
+    def _update_attrs(self) -> None:
         data = self._zone_data
-        if not data:
-            return None
-        return data.get("mute", False)
+        self._attr_is_on = data.get("mute", False) if data else None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.coordinator.client.set_mute(self._zone, True)
+        if await self.coordinator.client.set_mute(self._zone, True):
+            self.coordinator.async_apply_zone_value(self._zone, "mute", True)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.coordinator.client.set_mute(self._zone, False)
+        if await self.coordinator.client.set_mute(self._zone, False):
+            self.coordinator.async_apply_zone_value(self._zone, "mute", False)
         await self.coordinator.async_request_refresh()
 
 
 # ═══════════════════════════════════════════════════════════════════════
-# BMP40 Bluetooth Pairing Switch
+# XMP44 slot switch base
 # ═══════════════════════════════════════════════════════════════════════
 
-class BMP40PairingSwitch(CoordinatorEntity, SwitchEntity):
-    """Switch to enable/disable BMP40 Bluetooth pairing mode."""
+class XMP44SlotSwitch(CoordinatorEntity, SwitchEntity):
+    """Base for XMP44 slot switches backed by one field of the slot data.
+
+    Subclasses set the unique_id part, the slot data key with its on/off
+    values as polled, and the name of the XMP44Client setter that sends
+    the command.
+    """
 
     _attr_has_entity_name = True
-    _attr_icon = "mdi:bluetooth-settings"
+    _uid_part: str  # unique_id is "<entry_id>_<uid_part with slot>"
+    _key: str
+    _on_value: Any
+    _off_value: Any
+    _setter_name: str  # XMP44Client method taking (slot, flag)
 
     def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
         super().__init__(coordinator)
         self._slot = slot
-        self._entry = entry
-
-        self._attr_unique_id = f"{entry.entry_id}_bmp40_slot{slot}_pairing"
-        self._attr_name = "Pairing"
+        self._attr_unique_id = f"{entry.entry_id}_{self._uid_part.format(slot=slot)}"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
         }
         self._attr_extra_state_attributes = {"slot_number": slot}
+        self._update_is_on()
+
+    async def _async_set(self, on: bool) -> bool:
+        """Send the on/off command; return True if the device acknowledged it."""
+        return await getattr(self.coordinator.client, self._setter_name)(self._slot, on)
 
-    @property
-    def is_on(self) -> bool | None:
+    def _update_is_on(self) -> None:
         data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        slot_data = data[self._slot]
-        # Pairing state: 3=enabled, 4=disabled, 0=success
-        pairing = slot_data.get("pairing_state")
-        if pairing is None:
-            return None
-        return pairing == 3  # enabled
+        value = data[self._slot].get(self._key) if data and self._slot in data else None
+        self._attr_is_on = None if value is None else value == self._on_value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_is_on()
+        super()._handle_coordinator_update()
+
+    async def _async_turn(self, on: bool) -> None:
+        if await self._async_set(on):
+            self.coordinator.async_apply_slot_value(
+                self._slot, self._key, self._on_value if on else self._off_value
+            )
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.coordinator.client.set_pairing(self._slot, True)
-        await self.coordinator.async_request_refresh()
+        await self._async_turn(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.coordinator.client.set_pairing(self._slot, False)
-        await self.coordinator.async_request_refresh()
+        await self._async_turn(False)
 
 
 # ═══════════════════════════════════════════════════════════════════════
-# DMP40/TMP40 Stereo Switch
+# BMP40 Bluetooth Pairing Switch
 # ═══════════════════════════════════════════════════════════════════════
 
-class TunerStereoSwitch(CoordinatorEntity, SwitchEntity):
-    """Switch to toggle stereo/mono output for DMP40/TMP40 tuners."""
+class BMP40PairingSwitch(XMP44SlotSwitch):
+    """Switch to enable/disable BMP40 Bluetooth pairing mode."""
 
-    _attr_has_entity_name = True
-    _attr_icon = "mdi:surround-sound"
+    _attr_icon = "mdi:bluetooth-settings"
+    _attr_name = "Pairing"
+    _uid_part = "bmp40_slot{slot}_pairing"
+    # Pairing state: 3=enabled, 4=disabled, 0=success
+    _key = "pairing_state"
+    _on_value = 3
+    _off_value = 4
+    _setter_name = "set_pairing"
 
-    def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
-        super().__init__(coordinator)
-        self._slot = slot
-        self._attr_unique_id = f"{entry.entry_id}_tuner_slot{slot}_stereo"
-        self._attr_name = "Stereo"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
-        }
-        self._attr_extra_state_attributes = {"slot_number": slot}
+    async def _async_turn(self, on: bool) -> None:
+        if not self.available:
+            raise HomeAssistantError(f"BMP40 in slot {self._slot} is unavailable")
+        await super()._async_turn(on)
 
-    @property
-    def is_on(self) -> bool | None:
-        data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        return data[self._slot].get("stereo")
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.coordinator.client.set_stereo(self._slot, True)
-        await self.coordinator.async_request_refresh()
+# ═══════════════════════════════════════════════════════════════════════
+# DMP40/TMP40 Stereo Switch
+# ═══════════════════════════════════════════════════════════════════════
 
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.coordinator.client.set_stereo(self._slot, False)
-        await self.coordinator.async_request_refresh()
+class TunerStereoSwitch(XMP44SlotSwitch):
+    """Switch to toggle stereo/mono output for DMP40/TMP40 tuners."""
+
+    _attr_icon = "mdi:surround-sound"
+    _attr_name = "Stereo"
+    _uid_part = "tuner_slot{slot}_stereo"
+    _key = "stereo"
+    _on_value = True
+    _off_value = False
+    _setter_name = "set_stereo"
 
 
 # ═══════════════════════════════════════════════════════════════════════
 # MMP40 Recorder Mode Switch
 # ═══════════════════════════════════════════════════════════════════════
 
-class MMP40RecorderModeSwitch(CoordinatorEntity, SwitchEntity):
+class MMP40RecorderModeSwitch(XMP44SlotSwitch):
     """Switch to toggle between player and recorder mode on MMP40."""
 
-    _attr_has_entity_name = True
     _attr_icon = "mdi:microphone"
-
-    def __init__(self, coordinator, entry: ConfigEntry, slot: int) -> None:
-        super().__init__(coordinator)
-        self._slot = slot
-        self._attr_unique_id = f"{entry.entry_id}_mmp40_slot{slot}_recorder"
-        self._attr_name = "Aufnahme-Modus"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_slot_{slot}")},
-        }
-        self._attr_extra_state_attributes = {"slot_number": slot}
-
-    @property
-    def is_on(self) -> bool | None:
-        data = self.coordinator.data
-        if not data or self._slot not in data:
-            return None
-        mode = data[self._slot].get("recorder_mode")
-        if mode is None:
-            return None
-        return mode == "recorder"
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.coordinator.client.set_recorder_mode(self._slot, True)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.coordinator.client.set_recorder_mode(self._slot, False)
-        await self.coordinator.async_request_refresh()
+    _attr_name = "Aufnahme-Modus"
+    _uid_part = "mmp40_slot{slot}_recorder"
+    _key = "recorder_mode"
+    _on_value = "recorder"
+    _off_value = "player"
+    _setter_name = "set_recorder_mode"
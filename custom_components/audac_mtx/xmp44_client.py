@@ -24,7 +24,7 @@ import asyncio
 import logging
 from typing import Any
 
-from .audac_client import AudacClient, INTER_COMMAND_DELAY
+from .audac_client import AudacClient
 from .const import DEFAULT_PORT, DEFAULT_SOURCE
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,6 +52,9 @@ MODULE_NAMES = {
     MODULE_UNSUPPORTED: None,
 }
 
+# GTPS type field (as sent) -> module type ID, for the known modules
+_TPS_TYPE_IDS = {str(type_id): type_id for type_id in MODULE_NAMES}
+
 MODULE_DESCRIPTIONS = {
     MODULE_DMP40: "DAB/DAB+ & FM Tuner",
     MODULE_TMP40: "FM Tuner",
@@ -74,6 +77,10 @@ MODULES_WITH_TUNER = {MODULE_DMP40, MODULE_TMP40}
 # Modules that support DAB band switching
 MODULES_WITH_DAB = {MODULE_DMP40}
 
+# Module identity fields (BMP40 Bluetooth info, NMP40 player name/IP) only
+# change when the module is reconfigured; re-read them every N polls.
+STATIC_REFRESH_POLLS = 10
+
 # Hard timeout for the entire get_all_slots() call
 GET_ALL_SLOTS_TIMEOUT = 45.0
 
@@ -91,6 +98,11 @@ class XMP44Client(AudacClient):
         self._module_types: dict[int, int] = {}
         self._module_names: dict[int, str | None] = {}
         self._module_versions: dict[int, str] = {}
+        # {slot: fields} from the last static read, see STATIC_REFRESH_POLLS.
+        self._static_fields: dict[int, dict[str, Any]] = {}
+        # Slots whose last static read missed a field; retried every poll.
+        self._static_incomplete: set[int] = set()
+        self._static_polls = 0
 
     @property
     def module_types(self) -> dict[int, int]:
@@ -112,6 +124,8 @@ class XMP44Client(AudacClient):
         """
         self._module_types = {}
         self._module_names = {}
+        self._static_fields = {}
+        self._static_incomplete = set()
         for slot, type_id in module_config.items():
             self._module_types[slot] = type_id
             self._module_names[slot] = MODULE_NAMES.get(type_id)
@@ -133,22 +147,22 @@ class XMP44Client(AudacClient):
         values = data.split("^")
         self._module_types = {}
         self._module_names = {}
+        self._static_fields = {}
+        self._static_incomplete = set()
         self._module_versions = {}
 
-        # First 4 values are module type IDs
+        # First 4 values are module type IDs. Known IDs resolve through the
+        # table; int() is only needed for unexpected values.
         for slot in range(1, XMP44_SLOTS + 1):
-            idx = slot - 1
-            if idx < len(values):
+            raw = values[slot - 1].strip() if slot <= len(values) else ""
+            type_id = _TPS_TYPE_IDS.get(raw)
+            if type_id is None:
                 try:
-                    type_id = int(values[idx])
-                    self._module_types[slot] = type_id
-                    self._module_names[slot] = MODULE_NAMES.get(type_id)
-                except (ValueError, TypeError):
-                    self._module_types[slot] = MODULE_EMPTY
-                    self._module_names[slot] = None
-            else:
-                self._module_types[slot] = MODULE_EMPTY
-                self._module_names[slot] = None
+                    type_id = int(raw)
+                except ValueError:
+                    type_id = MODULE_EMPTY
+            self._module_types[slot] = type_id
+            self._module_names[slot] = MODULE_NAMES.get(type_id)
 
         # Remaining values are "ModuleName Vx.y.z" strings
         for slot in range(1, XMP44_SLOTS + 1):
@@ -411,7 +425,6 @@ class XMP44Client(AudacClient):
                 seen_pointers.add(s["pointer"])
             all_stations.extend(new_items)
             start += 10
-            await asyncio.sleep(INTER_COMMAND_DELAY)
         _LOGGER.debug("Loaded %d favourites for slot %d", len(all_stations), slot)
         return all_stations
 
@@ -531,9 +544,8 @@ class XMP44Client(AudacClient):
             )
         except asyncio.TimeoutError:
             _LOGGER.warning("get_all_slots() timed out — forcing disconnect")
-            self._writer = None
-            self._reader = None
-            self._consecutive_failures += 1
+            self._force_disconnect()
+            self._record_failure()
             raise ConnectionError("get_all_slots timed out") from None
 
     async def _get_all_slots_inner(self) -> dict[int, dict[str, Any]]:
@@ -541,6 +553,9 @@ class XMP44Client(AudacClient):
             _LOGGER.warning("XMP44: No module configuration set — configure modules in integration options")
             return {}
 
+        refresh_static = self._static_polls % STATIC_REFRESH_POLLS == 0
+        self._static_polls += 1
+
         slots: dict[int, dict[str, Any]] = {}
         for slot in range(1, XMP44_SLOTS + 1):
             type_id = self._module_types.get(slot, MODULE_EMPTY)
@@ -561,96 +576,81 @@ class XMP44Client(AudacClient):
                 gain = await self.get_output_gain(slot)
                 if gain is not None:
                     slot_data["output_gain"] = gain
-                await asyncio.sleep(INTER_COMMAND_DELAY)
 
                 # Player status (playback modules)
                 if type_id in MODULES_WITH_PLAYBACK:
                     status = await self.get_player_status(slot)
                     slot_data["status"] = status
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
                 # Song info (playback + internet radio)
                 if type_id in MODULES_WITH_SONG_INFO:
                     song_info = await self.get_song_info(slot)
                     if song_info:
                         slot_data["song_info"] = song_info
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
                 # MMP40: recorder mode
                 if type_id == MODULE_MMP40:
                     rec_mode = await self.get_recorder_mode(slot)
                     if rec_mode is not None:
                         slot_data["recorder_mode"] = rec_mode
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
                 # Tuner info
                 if type_id in MODULES_WITH_TUNER:
                     freq = await self.get_frequency(slot)
                     if freq is not None:
                         slot_data["frequency"] = freq
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
                     prog_name = await self.get_program_name(slot)
                     if prog_name:
                         slot_data["program_name"] = prog_name
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
                     signal = await self.get_signal_strength(slot)
                     if signal is not None:
                         slot_data["signal_strength"] = signal
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
                     stereo = await self.get_stereo_state(slot)
                     if stereo is not None:
                         slot_data["stereo"] = stereo
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
                     if type_id in MODULES_WITH_DAB:
                         band = await self.get_band(slot)
                         if band:
                             slot_data["band"] = band
-                        await asyncio.sleep(INTER_COMMAND_DELAY)
 
                 # Internet radio: station name + song name
                 if type_id == MODULE_IMP40:
                     station = await self.get_station_name(slot)
                     if station:
                         slot_data["station_name"] = station
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
                     song_name = await self.get_song_name(slot)
                     if song_name:
                         slot_data["song_name"] = song_name
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
-                # Bluetooth: info, connected device, pairing state
+                # Module identity fields (BMP40 info, NMP40 name/IP)
+                static = self._static_fields.get(slot)
+                if refresh_static or static is None or slot in self._static_incomplete:
+                    fresh, complete = await self._get_static_fields(slot, type_id)
+                    # Fields that failed this time keep their last good value
+                    static = {**(static or {}), **fresh}
+                    if static:
+                        self._static_fields[slot] = static
+                    if complete:
+                        self._static_incomplete.discard(slot)
+                    else:
+                        self._static_incomplete.add(slot)
+                if static:
+                    slot_data.update(static)
+
+                # Bluetooth: connected device, pairing state
                 if type_id == MODULE_BMP40:
-                    bt_info = await self.get_bluetooth_info(slot)
-                    if bt_info:
-                        slot_data["bluetooth_info"] = bt_info
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
-
                     connected = await self.get_connected_device(slot)
                     if connected:
                         slot_data["connected_device"] = connected
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
                     pairing = await self.get_pairing_state(slot)
                     if pairing is not None:
                         slot_data["pairing_state"] = pairing
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
-
-                # NMP40: player name + IP
-                if type_id == MODULE_NMP40:
-                    pname = await self.get_player_name(slot)
-                    if pname:
-                        slot_data["player_name"] = pname
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
-
-                    pip = await self.get_player_ip(slot)
-                    if pip:
-                        slot_data["player_ip"] = pip
-                    await asyncio.sleep(INTER_COMMAND_DELAY)
 
             except ConnectionError:
                 raise
@@ -660,3 +660,26 @@ class XMP44Client(AudacClient):
             slots[slot] = slot_data
 
         return slots
+
+    async def _get_static_fields(self, slot: int, type_id: int) -> tuple[dict[str, Any], bool]:
+        """Read the slot fields that only change when the module is reconfigured.
+
+        Returns the fields that were read and whether every one of them was.
+        """
+        fields: dict[str, Any] = {}
+        expected = 0
+        if type_id == MODULE_BMP40:
+            expected = 1
+            bt_info = await self.get_bluetooth_info(slot)
+            if bt_info:
+                fields["bluetooth_info"] = bt_info
+        elif type_id == MODULE_NMP40:
+            expected = 2
+            pname = await self.get_player_name(slot)
+            if pname:
+                fields["player_name"] = pname
+
+            pip = await self.get_player_ip(slot)
+            if pip:
+                fields["player_ip"] = pip
+        return fields, len(fields) == expected
@@ -7,7 +7,8 @@ from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DOMAIN, CONF_MODEL, MODEL_XMP44
@@ -21,6 +22,10 @@ SCAN_INTERVAL = timedelta(seconds=30)
 # Slower polling when device is unreachable — retry every 3 minutes.
 SCAN_INTERVAL_SLOW = timedelta(seconds=180)
 
+# Delay before a refresh requested after a command; a burst of commands
+# (e.g. dragging a slider) collapses into one poll once the XMP44 has settled.
+REQUEST_REFRESH_COOLDOWN = 0.3
+
 # Hard timeout for a complete coordinator update cycle.
 UPDATE_TIMEOUT = 55.0
 
@@ -40,6 +45,11 @@ class XMP44Coordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
             _LOGGER,
             name=f"{DOMAIN}_xmp44",
             update_interval=SCAN_INTERVAL,
+            # Idle polls return equal data; only notify entities on a real change.
+            always_update=False,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False,
+            ),
         )
         self.entry = entry
         self.client = XMP44Client(
@@ -52,6 +62,17 @@ class XMP44Coordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
         self._favourites_loaded = False
         self._consecutive_update_failures = 0
 
+    @callback
+    def async_apply_slot_value(self, slot: int, key: str, value: Any) -> None:
+        """Show a value the device just accepted before the next poll confirms it.
+
+        The data is replaced (not mutated), so the follow-up poll is compared
+        against the optimistic value and reverts it if the device disagrees.
+        """
+        if not self.data or slot not in self.data:
+            return
+        self.async_set_updated_data({**self.data, slot: {**self.data[slot], key: value}})
+
     def _apply_module_config(self) -> None:
         """Read module configuration from entry options and apply to client."""
         slots_count = self.entry.data.get("slots", 4)